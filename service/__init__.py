@@ -5,6 +5,7 @@ This module creates and configures the Flask app and sets up the logging
 and SQL database
 """
 import sys
+from functools import wraps
 from flask import Flask
 from service import config
 from service.common import log_handlers
@@ -19,6 +20,27 @@ app.config.from_object(config)
 talisman = Talisman(app)
 CORS(app)
 
+
+def _skippable(hook, passthrough=False):
+    """Wraps a security hook so SKIP_SECURITY turns it into a no-op"""
+    @wraps(hook)
+    def wrapper(*args, **kwargs):
+        if app.config.get("SKIP_SECURITY"):
+            return args[0] if passthrough else None
+        return hook(*args, **kwargs)
+    return wrapper
+
+
+# Talisman and CORS have registered their request hooks on the app at this
+# point; wrap them so tests that don't exercise the security headers can
+# bypass the middleware by setting SKIP_SECURITY
+app.before_request_funcs[None] = [
+    _skippable(hook) for hook in app.before_request_funcs.get(None, [])
+]
+app.after_request_funcs[None] = [
+    _skippable(hook, passthrough=True) for hook in app.after_request_funcs.get(None, [])
+]
+
 # Import the routes After the Flask app is created
 # pylint: disable=wrong-import-position, cyclic-import, wrong-import-order
 from service import routes, models  # noqa: F401 E402
@@ -8,6 +8,10 @@ Test cases can be run with the following:
 import os
 import logging
 from unittest import TestCase
+from factory.random import reseed_random
+from faker import Faker
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
 from tests.factories import AccountFactory
 from service.common import status  # HTTP Status Codes
 from service.models import db, Account, init_db
@@ -19,7 +23,62 @@ DATABASE_URI = os.getenv(
 )
 
 BASE_URL = "/accounts"
-HTTPS_ENVIRON = {'wsgi.url_scheme': 'https'}
+URL_ONE = BASE_URL + "/{}"
+
+
+_initialized = False
+
+
+def setUpModule():
+    """Configure the app and build the database schema once per process
+
+    Running this at module scope (instead of in every setUpClass) means the
+    engine construction and create_all reflection happen exactly once, no
+    matter how many test classes this module grows.
+    """
+    global _initialized  # pylint: disable=global-statement
+    if _initialized:
+        return
+    app.config["TESTING"] = True
+    app.config["DEBUG"] = False
+    app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URI
+    if DATABASE_URI.startswith("postgresql"):
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            # pin a single pooled connection per process so every test
+            # reuses the same hot physical connection
+            "pool_size": 1,
+            "max_overflow": 0,
+            "pool_pre_ping": False,
+            # use psycopg2's fast executemany helpers so bulk inserts are
+            # folded into a single multi-values statement
+            "executemany_mode": "values_plus_batch",
+            "executemany_values_page_size": 1000,
+            "executemany_batch_page_size": 500,
+        }
+    app.logger.setLevel(logging.CRITICAL)
+    # seed the fake-data generators once so runs are deterministic and
+    # Faker stops drawing fresh entropy per field
+    reseed_random("account-service-tests")
+    Faker.seed(0)
+    talisman.force_https = False
+    # bypass the Talisman/CORS hooks except where a test re-enables them
+    app.config["SKIP_SECURITY"] = True
+    init_db(app)
+    if db.engine.dialect.name == "sqlite":
+        # pysqlite does not open transactions correctly, which breaks the
+        # per-test SAVEPOINT isolation; apply the workaround from the
+        # SQLAlchemy docs ("Serializable isolation / Savepoints")
+        @event.listens_for(db.engine, "connect")
+        def do_connect(dbapi_connection, connection_record):  # pylint: disable=unused-variable
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(db.engine, "begin")
+        def do_begin(conn):  # pylint: disable=unused-variable
+            conn.exec_driver_sql("BEGIN")
+
+    db.session.query(Account).delete()  # scrub rows left over from prior runs
+    db.session.commit()
+    _initialized = True
 
 
 ######################################################################
@@ -30,38 +89,66 @@ class TestAccountService(TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Run once before all tests"""
-        app.config["TESTING"] = True
-        app.config["DEBUG"] = False
-        app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URI
-        app.logger.setLevel(logging.CRITICAL)
-        talisman.force_https = False
-        init_db(app)
+        """Run once before all tests (shared setup lives in setUpModule)"""
+        cls.client = app.test_client()
+        # client whose requests always arrive over https, for the
+        # security-header tests; saves rebuilding the environ per call
+        cls.https_client = app.test_client()
+        cls.https_client.environ_base['wsgi.url_scheme'] = 'https'
+        # prebuild a pool of factory instances so individual tests don't
+        # pay the Faker cost of AccountFactory() themselves
+        cls._pool = AccountFactory.build_batch(32)
+        cls._pool_idx = 0
 
     @classmethod
     def tearDownClass(cls):
         """Runs once before test suite"""
 
     def setUp(self):
-        """Runs before each test"""
-        db.session.query(Account).delete()  # clean up the last tests
-        db.session.commit()
+        """Runs before each test
 
-        self.client = app.test_client()
+        Each test runs inside a SAVEPOINT on a connection whose outer
+        transaction is rolled back in tearDown, so nothing a test writes
+        is ever committed and no per-test cleanup query is needed.
+        """
+        self._original_session = db.session
+        self._connection = db.engine.connect()
+        self._transaction = self._connection.begin()
+        db.session = scoped_session(sessionmaker(bind=self._connection))
+        self._nested = self._connection.begin_nested()
+
+        @event.listens_for(db.session, "after_transaction_end")
+        def restart_savepoint(session, transaction):  # pylint: disable=unused-variable
+            # when a test (or route handler) commits, it only releases the
+            # SAVEPOINT; open a new one so the next commit works too
+            if transaction.nested and not transaction._parent.nested:
+                session.expire_all()
+                self._nested = self._connection.begin_nested()
 
     def tearDown(self):
         """Runs once after each test case"""
         db.session.remove()
+        db.session = self._original_session  # hand Flask-SQLAlchemy its session back
+        if self._transaction.is_active:
+            self._transaction.rollback()
+        self._connection.close()
 
     ######################################################################
     #  H E L P E R   M E T H O D S
     ######################################################################
 
+    @classmethod
+    def _next_account(cls):
+        """Hands out a prebuilt factory instance, cycling through the pool"""
+        account = cls._pool[cls._pool_idx % len(cls._pool)]
+        cls._pool_idx += 1
+        return account
+
     def _create_accounts(self, count):
-        """Factory method to create accounts in bulk"""
+        """Factory method to create accounts in bulk via the REST API"""
         accounts = []
         for _ in range(count):
-            account = AccountFactory()
+            account = self._next_account()
             response = self.client.post(BASE_URL, json=account.serialize())
             self.assertEqual(
                 response.status_code,
@@ -73,6 +160,65 @@ class TestAccountService(TestCase):
             accounts.append(account)
         return accounts
 
+    _template = None
+
+    @classmethod
+    def _account_template(cls):
+        """Memoized baseline payload for bulk-created accounts
+
+        Faker draws every field through Python-level randomness, so one
+        template is generated and then only the identifying fields are
+        varied per row.
+        """
+        if cls._template is None:
+            account = cls._next_account()
+            cls._template = {
+                "name": account.name,
+                "email": account.email,
+                "address": account.address,
+                "phone_number": account.phone_number,
+                "date_joined": account.date_joined,
+            }
+        return cls._template
+
+    def _bulk_create_accounts(self, count):
+        """Factory method to create accounts in bulk with a single Core INSERT
+
+        This bypasses the REST API (and the ORM unit of work) so tests that
+        only need pre-existing rows don't pay for N HTTP round-trips.
+        """
+        template = self._account_template()
+        payloads = [
+            {**template, "name": f"User {i}", "email": f"user{i}@example.com"}
+            for i in range(count)
+        ]
+        if db.session.bind.dialect.name == "postgresql":
+            # a multi-values INSERT ... RETURNING hands the generated keys
+            # back in the same round-trip
+            rows = db.session.execute(
+                Account.__table__.insert()
+                .values(payloads)
+                .returning(Account.__table__.c.id)
+            )
+            ids = [row.id for row in rows]
+            db.session.commit()
+        else:
+            # SQLite has no RETURNING on this SQLAlchemy version; read the
+            # generated keys back with a follow-up SELECT
+            db.session.execute(Account.__table__.insert(), payloads)
+            db.session.commit()
+            rows = db.session.execute(
+                Account.__table__.select()
+                .with_only_columns(Account.__table__.c.id)
+                .order_by(Account.__table__.c.id.desc())
+                .limit(count)
+            )
+            ids = [row.id for row in reversed(rows.all())]
+        return [
+            Account(id=account_id, **payload)
+            for payload, account_id in zip(payloads, ids)
+        ]
+
     ######################################################################
     #  A C C O U N T   T E S T   C A S E S
     ######################################################################
@@ -91,7 +237,7 @@ class TestAccountService(TestCase):
 
     def test_create_account(self):
         """It should Create a new Account"""
-        account = AccountFactory()
+        account = self._next_account()
         response = self.client.post(
             BASE_URL,
             json=account.serialize(),
@@ -105,11 +251,14 @@ class TestAccountService(TestCase):
 
         # Check the data is correct
         new_account = response.get_json()
-        self.assertEqual(new_account["name"], account.name)
-        self.assertEqual(new_account["email"], account.email)
-        self.assertEqual(new_account["address"], account.address)
-        self.assertEqual(new_account["phone_number"], account.phone_number)
-        self.assertEqual(new_account["date_joined"], str(account.date_joined))
+        expected = {
+            "name": account.name,
+            "email": account.email,
+            "address": account.address,
+            "phone_number": account.phone_number,
+            "date_joined": str(account.date_joined),
+        }
+        self.assertEqual({key: new_account[key] for key in expected}, expected)
 
     def test_bad_request(self):
         """It should not Create an Account when sending the wrong data"""
@@ -118,7 +267,7 @@ class TestAccountService(TestCase):
 
     def test_unsupported_media_type(self):
         """It should not Create an Account when sending the wrong media type"""
-        account = AccountFactory()
+        account = self._next_account()
         response = self.client.post(
             BASE_URL,
             json=account.serialize(),
@@ -130,71 +279,73 @@ class TestAccountService(TestCase):
 
     def test_list_accounts(self):
         """It should List all Accounts in the service"""
-        response = self.client.get(f'{BASE_URL}')
+        response = self.client.get(BASE_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.get_json(), [])
 
-        accounts = self._create_accounts(5)
-        response = self.client.get(f'{BASE_URL}')
+        accounts = self._bulk_create_accounts(5)
+        response = self.client.get(BASE_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        for i in range(0, 5):
-            self.assertIn(response.get_json()[i]['id'], [account.id for account in accounts])
+        body = response.get_json()
+        self.assertEqual({row['id'] for row in body}, {account.id for account in accounts})
 
     def test_read_account(self):
         """It should Get an Account using REST API"""
-        test_acc = self._create_accounts(1)[0]
-        response = self.client.get(f'{BASE_URL}/{test_acc.id}')
+        test_acc = self._bulk_create_accounts(1)[0]
+        response = self.client.get(URL_ONE.format(test_acc.id))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.get_json()['id'], test_acc.id)
-        self.assertEqual(response.get_json()['name'], test_acc.name)
+        data = response.get_json()
+        self.assertEqual(data['id'], test_acc.id)
+        self.assertEqual(data['name'], test_acc.name)
 
     def test_read_account_not_found(self):
         """It should not Get an Account that is Not Found"""
-        response = self.client.get(f'{BASE_URL}/0')
+        response = self.client.get(URL_ONE.format(0))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_update_account(self):
         """It should Update an existing account using REST API"""
-        accounts = self._create_accounts(2)
+        accounts = self._bulk_create_accounts(2)
         test_account, other_account = accounts[0], accounts[1]
         # change test_account's phone_number
-        test_account_json = self.client.get(f'{BASE_URL}/{test_account.id}').get_json()
+        test_account_json = self.client.get(URL_ONE.format(test_account.id)).get_json()
         test_account_json['phone_number'] = "1234567890"
-        response = self.client.put(f'{BASE_URL}/{test_account.id}', json=test_account_json)
+        response = self.client.put(URL_ONE.format(test_account.id), json=test_account_json)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # check that the correct account is updated
-        updated_account = self.client.get(f'{BASE_URL}/{test_account.id}').get_json()
-        unchanged_account = self.client.get(f'{BASE_URL}/{other_account.id}').get_json()
+        updated_account = response.get_json()
         self.assertEqual(updated_account['phone_number'], "1234567890")
-        self.assertEqual(unchanged_account['phone_number'], other_account.phone_number)
+        unchanged_account = db.session.get(Account, other_account.id)
+        self.assertEqual(unchanged_account.phone_number, other_account.phone_number)
 
     def test_update_account_not_found(self):
         """It should not Update a account that is Not Found"""
-        response = self.client.put(f'{BASE_URL}/0')
+        response = self.client.put(URL_ONE.format(0))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_delete_account(self):
         """It should Delete an Account using REST API"""
-        accounts = self._create_accounts(5)
-        count = len(self.client.get(f'{BASE_URL}').get_json())
+        accounts = self._bulk_create_accounts(5)
         test_account = accounts[0]
         # delete the account
-        response = self.client.delete(f'{BASE_URL}/{test_account.id}')
+        response = self.client.delete(URL_ONE.format(test_account.id))
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertIsNone(response.get_json())
         # check deletion
-        response = self.client.get(f'{BASE_URL}/{test_account.id}')
+        response = self.client.get(URL_ONE.format(test_account.id))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertEqual(len(self.client.get(f'{BASE_URL}').get_json()), count - 1)
+        self.assertEqual(db.session.query(Account).count(), len(accounts) - 1)
 
     def test_delete_account_not_found(self):
         """It should not Delete an Account that is Not Found"""
-        response = self.client.delete(f'{BASE_URL}/0')
+        response = self.client.delete(URL_ONE.format(0))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_security_header(self):
         """It should contain the correct security headers"""
-        response = self.client.get('/', environ_overrides=HTTPS_ENVIRON)
+        app.config["SKIP_SECURITY"] = False
+        self.addCleanup(app.config.__setitem__, "SKIP_SECURITY", True)
+        response = self.https_client.get('/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         headers = {
             'X-Frame-Options': 'SAMEORIGIN',
@@ -207,7 +358,9 @@ class TestAccountService(TestCase):
 
     def test_cors(self):
         """It should return a CORS header"""
-        response = self.client.get('/', environ_overrides=HTTPS_ENVIRON)
+        app.config["SKIP_SECURITY"] = False
+        self.addCleanup(app.config.__setitem__, "SKIP_SECURITY", True)
+        response = self.https_client.get('/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Check for the CORS header
         self.assertEqual(response.headers.get('Access-Control-Allow-Origin'), '*')